@@ -53,6 +53,7 @@ from autolab.validators import _run_verification_step
 from autolab.todo_sync import (
     _load_todo_state,
     _normalize_text_key,
+    _task_scope_class,
     mark_task_completed,
     select_open_task,
 )
@@ -233,8 +234,7 @@ def _is_blocker_task_resolved(
     if not isinstance(task, dict):
         return (True, "task not found in todo_state")
 
-    scope = str(task.get("scope", "")).strip()
-    if not scope.startswith("review:blocker:"):
+    if _task_scope_class(task) != "blocker":
         return (True, "not a blocker task")
 
     fingerprint, findings = _review_blocker_fingerprint(repo_root, state)
@@ -3,8 +3,9 @@ from __future__ import annotations
 import hashlib
 import json
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +14,11 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     yaml = None
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
 from autolab.dataset_discovery import discover_media_inputs, summarize_root_counts
 
 
@@ -37,8 +43,9 @@ DECISION_TO_DESIGN_STAGES = {
     "extract_results",
     "update_docs",
 }
-FALLBACK_SCOPE_LOCAL = "policy:no_task_fallback:local"
-FALLBACK_SCOPE_SLURM = "policy:no_task_fallback:slurm"
+FALLBACK_SCOPE_PREFIX = "policy:no_task_fallback:"
+FALLBACK_SCOPE_LOCAL = f"{FALLBACK_SCOPE_PREFIX}local"
+FALLBACK_SCOPE_SLURM = f"{FALLBACK_SCOPE_PREFIX}slurm"
 REVIEW_BLOCKER_SCOPE_PREFIX = "review:blocker:"
 _DEFAULT_FALLBACK_TASK_TEXT_LOCAL = (
     "No remaining actionable tasks were detected on local execution context. "
@@ -95,6 +102,23 @@ class _GeneratedCandidate:
     scope: str
 
 
+@dataclass(frozen=True)
+class _TodoPaths:
+    todo: Path
+    state: Path
+    focus: Path
+
+
+@lru_cache(maxsize=256)
+def _todo_paths(repo_root: Path) -> _TodoPaths:
+    autolab_dir = repo_root / ".autolab"
+    return _TodoPaths(
+        todo=repo_root / "docs" / "todo.md",
+        state=autolab_dir / "todo_state.json",
+        focus=autolab_dir / "todo_focus.json",
+    )
+
+
 def _utc_now() -> str:
     return (
         datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
@@ -331,16 +355,36 @@ def _hash_task_id(source: str, scope: str, stage: str, text_key: str) -> str:
 
 
 def _write_text_if_changed(path: Path, content: str) -> bool:
-    if path.exists() and path.read_text(encoding="utf-8") == content:
-        return False
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            return False
+    except FileNotFoundError:
+        pass
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(content, encoding="utf-8")
     return True
 
 
+def _dump_json_text(payload: dict[str, Any]) -> str:
+    # todo state only holds str/int/bool/None values, for which orjson and the
+    # stdlib fallback (ensure_ascii=False, matching orjson's raw UTF-8) emit
+    # identical text, so files do not churn when orjson is installed or
+    # removed. Floats can differ (1e16 vs 1e+16), and values orjson rejects,
+    # such as ints wider than 64 bits, go through the fallback.
+    if orjson is not None:
+        try:
+            raw = orjson.dumps(
+                payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+            )
+        except TypeError:
+            pass
+        else:
+            return raw.decode("utf-8") + "\n"
+    return json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=False) + "\n"
+
+
 def _write_json_if_changed(path: Path, payload: dict[str, Any]) -> bool:
-    content = json.dumps(payload, indent=2, sort_keys=True) + "\n"
-    return _write_text_if_changed(path, content)
+    return _write_text_if_changed(path, _dump_json_text(payload))
 
 
 def _default_todo_content() -> str:
@@ -353,11 +397,20 @@ def _default_todo_content() -> str:
     )
 
 
+def _loads_json_bytes(raw: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects some inputs the stdlib accepts (e.g. NaN).
+            pass
+    return json.loads(raw.decode("utf-8"))
+
+
 def _load_json_dict(path: Path, default: dict[str, Any]) -> dict[str, Any]:
-    if not path.exists():
-        return dict(default)
+    # A missing file lands in the except branch; no separate exists() probe.
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = _loads_json_bytes(path.read_bytes())
     except Exception:
         return dict(default)
     if not isinstance(payload, dict):
@@ -376,9 +429,29 @@ def _load_todo_state(path: Path) -> dict[str, Any]:
     if state["next_order"] < 1:
         state["next_order"] = 1
     state["version"] = 1
+    # scope_class is derived, never trusted from disk: recompute it so a
+    # stale or hand-edited value cannot misclassify blockers.
+    for task in state["tasks"].values():
+        if isinstance(task, dict):
+            task["scope_class"] = _scope_class(
+                source=str(task.get("source", "")), scope=str(task.get("scope", ""))
+            )
     return state
 
 
+def _write_todo_state_if_changed(path: Path, state: dict[str, Any]) -> bool:
+    """Persist todo state without the in-memory ``scope_class`` field."""
+    tasks = {
+        task_id: (
+            {key: value for key, value in task.items() if key != "scope_class"}
+            if isinstance(task, dict)
+            else task
+        )
+        for task_id, task in state["tasks"].items()
+    }
+    return _write_json_if_changed(path, {**state, "tasks": tasks})
+
+
 def _load_max_generated_todo_tasks(repo_root: Path) -> int:
     try:
         from autolab.config import _load_guardrail_config
@@ -389,13 +462,15 @@ def _load_max_generated_todo_tasks(repo_root: Path) -> int:
         return DEFAULT_MAX_GENERATED_TODO_TASKS
 
 
-def _extract_sections(todo_text: str) -> tuple[list[str], list[str], bool]:
-    lines = todo_text.splitlines()
+def _extract_sections(lines: list[str]) -> tuple[list[str], list[str], bool]:
     tasks_lines: list[str] = []
     notes_lines: list[str] = []
+    fallback_lines: list[str] = []
     section = ""
     seen_tasks = False
 
+    # Single pass: lines outside "## Notes" are collected alongside the
+    # section split so a todo without "## Tasks" needs no second walk.
     for line in lines:
         stripped = line.strip()
         lowered = stripped.lower()
@@ -408,96 +483,155 @@ def _extract_sections(todo_text: str) -> tuple[list[str], list[str], bool]:
             continue
         if stripped.startswith("## "):
             section = "other"
+            fallback_lines.append(line)
             continue
 
         if section == "tasks":
             tasks_lines.append(line)
         elif section == "notes":
             notes_lines.append(line)
+        if section != "notes":
+            fallback_lines.append(line)
 
     if not seen_tasks:
-        fallback = []
-        in_notes = False
-        for line in lines:
-            stripped = line.strip()
-            lowered = stripped.lower()
-            if lowered == "## notes":
-                in_notes = True
-                continue
-            if stripped.startswith("## "):
-                in_notes = False
-            if not in_notes:
-                fallback.append(line)
-        tasks_lines = fallback
+        tasks_lines = fallback_lines
 
     return tasks_lines, notes_lines, seen_tasks
 
 
-def _parse_bullets(tasks_lines: list[str]) -> list[_ParsedBullet]:
-    bullet_pattern = re.compile(r"^([ \t]*)([-*+]|(?:\d+[\.\)]))\s+(.*)$")
-    bullets: list[str] = []
+def _read_todo_sections(todo_path: Path) -> tuple[list[str], list[str], bool]:
+    try:
+        todo_text = todo_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        todo_text = _default_todo_content()
+    return _extract_sections(todo_text.splitlines())
+
+
+@dataclass
+class _BulletScanState:
+    bullets: list[str] = field(default_factory=list)
     current: str | None = None
     base_indent: int | None = None
-    in_comment = False
+    in_comment: bool = False
+
+
+def _flush_current_bullet(state: _BulletScanState) -> None:
+    if state.current is not None:
+        state.bullets.append(state.current)
+        state.current = None
+
+
+def _append_to_current_bullet(state: _BulletScanState, text: str) -> None:
+    if state.current is not None:
+        state.current = _normalize_space(f"{state.current} {text}")
+
+
+def _list_marker_length(content: str) -> int:
+    """Return the length of a leading ``-``/``*``/``+``/``1.``/``1)`` marker.
+
+    Zero means *content* is not a list item (the marker must be followed by
+    whitespace).
+    """
+    if content[:1] in ("-", "*", "+"):
+        end = 1
+    else:
+        end = 0
+        while end < len(content) and content[end].isdecimal():
+            end += 1
+        if end == 0 or content[end : end + 1] not in (".", ")"):
+            return 0
+        end += 1
+    if not content[end : end + 1].isspace():
+        return 0
+    return end
+
+
+def _scan_text_line(raw_line: str, stripped: str, state: _BulletScanState) -> None:
+    _append_to_current_bullet(state, stripped)
+
+
+def _scan_heading_line(raw_line: str, stripped: str, state: _BulletScanState) -> None:
+    _flush_current_bullet(state)
+
+
+def _scan_comment_line(raw_line: str, stripped: str, state: _BulletScanState) -> None:
+    if not stripped.startswith("<!--"):
+        _scan_text_line(raw_line, stripped, state)
+        return
+    if "-->" not in stripped:
+        state.in_comment = True
+
+
+def _scan_list_line(raw_line: str, stripped: str, state: _BulletScanState) -> None:
+    content = raw_line.lstrip(" \t")
+    marker_length = _list_marker_length(content)
+    if not marker_length:
+        _scan_text_line(raw_line, stripped, state)
+        return
+
+    indent_raw = raw_line[: len(raw_line) - len(content)]
+    indent = len(indent_raw) + 3 * indent_raw.count("\t")
+    body = content[marker_length:].strip()
+    if state.base_indent is None or indent < state.base_indent:
+        state.base_indent = indent
+    if indent <= state.base_indent:
+        _flush_current_bullet(state)
+        state.current = body
+    elif state.current is None:
+        state.current = body
+    else:
+        _append_to_current_bullet(state, body)
+
+
+_BULLET_LINE_HANDLERS = {
+    "#": _scan_heading_line,
+    "<": _scan_comment_line,
+    "-": _scan_list_line,
+    "*": _scan_list_line,
+    "+": _scan_list_line,
+}
+
+
+def _split_checkbox(text: str) -> tuple[str, bool | None]:
+    """Strip a leading ``[ ]``/``[x]`` checkbox; ``None`` means no checkbox."""
+    if text[:1] != "[" or text[2:3] != "]" or not text[3:4].isspace():
+        return text, None
+    mark = text[1:2]
+    if mark in ("x", "X"):
+        return text[4:].strip(), True
+    if mark.isspace():
+        return text[4:].strip(), False
+    return text, None
+
+
+def _parse_bullets(tasks_lines: list[str]) -> list[_ParsedBullet]:
+    state = _BulletScanState()
 
     for raw_line in tasks_lines:
         stripped = raw_line.strip()
         if not stripped:
             continue
 
-        if in_comment:
+        if state.in_comment:
             if "-->" in stripped:
-                in_comment = False
-            continue
-        if stripped.startswith("<!--"):
-            if "-->" not in stripped:
-                in_comment = True
-            continue
-
-        match = bullet_pattern.match(raw_line)
-        if match:
-            indent_raw = match.group(1).replace("\t", "    ")
-            indent = len(indent_raw)
-            body = match.group(3).strip()
-            if base_indent is None or indent < base_indent:
-                base_indent = indent
-            top_level = indent <= int(base_indent or 0)
-            if top_level:
-                if current is not None:
-                    bullets.append(current)
-                current = body
-            else:
-                if current is None:
-                    current = body
-                else:
-                    current = _normalize_space(f"{current} {body}")
-            continue
-
-        if stripped.startswith("#"):
-            if current is not None:
-                bullets.append(current)
-                current = None
+                state.in_comment = False
             continue
 
-        if current is not None:
-            current = _normalize_space(f"{current} {stripped}")
+        first = stripped[0]
+        # Numbered items may start with any Unicode decimal digit, matching
+        # _list_marker_length's str.isdecimal() check.
+        if first.isdecimal():
+            handler = _scan_list_line
+        else:
+            handler = _BULLET_LINE_HANDLERS.get(first, _scan_text_line)
+        handler(raw_line, stripped, state)
 
-    if current is not None:
-        bullets.append(current)
+    _flush_current_bullet(state)
 
     parsed: list[_ParsedBullet] = []
-    for idx, bullet in enumerate(bullets, start=1):
-        text = bullet.strip()
-        checked = False
-
-        match_checked = re.match(r"^\[(x|X)\]\s+(.*)$", text)
-        if match_checked:
-            checked = True
-            text = match_checked.group(2).strip()
-        else:
-            match_unchecked = re.match(r"^\[\s\]\s+(.*)$", text)
-            if match_unchecked:
-                text = match_unchecked.group(1).strip()
+    for idx, bullet in enumerate(state.bullets, start=1):
+        text, checkbox = _split_checkbox(bullet.strip())
+        checked = bool(checkbox)
 
         stage_tag = None
         match_stage = re.search(
@@ -679,12 +813,14 @@ def _is_iteration_completed_in_backlog(
 
 
 def _extract_open_questions(path: Path) -> list[str]:
-    if not path.exists():
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return []
     questions: list[str] = []
     in_open_section = False
 
-    for raw_line in path.read_text(encoding="utf-8").splitlines():
+    for raw_line in text.splitlines():
         stripped = raw_line.strip()
         lowered = stripped.lower()
 
@@ -730,10 +866,11 @@ def _extract_open_questions(path: Path) -> list[str]:
 
 
 def _extract_pending_lines(path: Path) -> list[str]:
-    if not path.exists():
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
         return []
 
-    lines = path.read_text(encoding="utf-8").splitlines()
     keywords = ("pending", "defer", "deferred", "todo", "to do", "later", "next step")
     pending: list[str] = []
 
@@ -768,6 +905,27 @@ def _is_blocker_scope(scope: str) -> bool:
     return _normalize_space(scope).startswith(REVIEW_BLOCKER_SCOPE_PREFIX)
 
 
+def _scope_class(*, source: str, scope: str) -> str:
+    normalized_scope = _normalize_space(scope)
+    if normalized_scope.startswith(REVIEW_BLOCKER_SCOPE_PREFIX):
+        return "blocker"
+    if normalized_scope.startswith(FALLBACK_SCOPE_PREFIX):
+        return "fallback"
+    if source == "manual":
+        return "manual"
+    return "other"
+
+
+def _task_scope_class(task: dict[str, Any]) -> str:
+    """Return the ``scope_class`` set on load/upsert, deriving it otherwise."""
+    scope_class = task.get("scope_class")
+    if isinstance(scope_class, str) and scope_class:
+        return scope_class
+    return _scope_class(
+        source=str(task.get("source", "")), scope=str(task.get("scope", ""))
+    )
+
+
 def _looks_like_blocker_task_text(text: str) -> bool:
     lowered = _normalize_space(text).lower()
     blocker_tokens = (
@@ -780,41 +938,43 @@ def _looks_like_blocker_task_text(text: str) -> bool:
     return any(token in lowered for token in blocker_tokens)
 
 
+# Blocking findings are free-form (strings or dicts); these are the only shape
+# checks applied, so compile them once rather than per finding.
+_FINDING_STAGE_RE = re.compile(r"\bstage\s*[:=]\s*([a-z_]+)\b", re.IGNORECASE)
+_FINDING_STAGE_STRIP_RE = re.compile(r"\bstage\s*[:=]\s*[a-z_]+\s*;?\s*", re.IGNORECASE)
+_FINDING_DICT_FIELDS = (
+    "id",
+    "title",
+    "summary",
+    "finding",
+    "message",
+    "detail",
+    "reason",
+    "file",
+    "path",
+    "artifact_path",
+)
+_NON_ACTIONABLE_FINDINGS = frozenset({"none", "n/a", "na", "no blockers", "no blocker"})
+_NONE_FINDING_RE = re.compile(
+    r"\b(?:(?:verifier_)?failing_checks|blocking_findings|blockers?)\s*[:=]\s*none\b"
+)
+
+
 def _normalize_blocking_finding_text(value: Any) -> tuple[str, str]:
     stage_hint = ""
     if isinstance(value, str):
         raw_text = _normalize_space(value)
-        stage_match = re.search(
-            r"\bstage\s*[:=]\s*([a-z_]+)\b", raw_text, flags=re.IGNORECASE
-        )
+        stage_match = _FINDING_STAGE_RE.search(raw_text)
         if stage_match:
             stage_hint = stage_match.group(1).strip().lower()
-            raw_text = re.sub(
-                r"\bstage\s*[:=]\s*[a-z_]+\s*;?\s*",
-                "",
-                raw_text,
-                count=1,
-                flags=re.IGNORECASE,
-            )
+            raw_text = _FINDING_STAGE_STRIP_RE.sub("", raw_text, count=1)
         return (_normalize_space(raw_text), stage_hint)
     if isinstance(value, dict):
         raw_stage = str(value.get("stage", "")).strip().lower()
         if raw_stage:
             stage_hint = raw_stage
-        prioritized_fields = (
-            "id",
-            "title",
-            "summary",
-            "finding",
-            "message",
-            "detail",
-            "reason",
-            "file",
-            "path",
-            "artifact_path",
-        )
         parts: list[str] = []
-        for field in prioritized_fields:
+        for field in _FINDING_DICT_FIELDS:
             raw = str(value.get(field, "")).strip()
             if raw:
                 parts.append(f"{field}={raw}")
@@ -828,80 +988,59 @@ def _is_actionable_blocking_finding(text: str) -> bool:
     lowered = _normalize_space(text).lower()
     if not lowered:
         return False
-    if lowered in {"none", "n/a", "na", "no blockers", "no blocker"}:
+    if lowered in _NON_ACTIONABLE_FINDINGS:
         return False
-    if re.search(r"\b(?:verifier_)?failing_checks\s*[:=]\s*none\b", lowered):
-        return False
-    if re.search(r"\bblocking_findings\s*[:=]\s*none\b", lowered):
-        return False
-    if re.search(r"\bblockers?\s*[:=]\s*none\b", lowered):
+    if _NONE_FINDING_RE.search(lowered):
         return False
     return True
 
 
+# Each tier is one alternation so a finding is scanned once per tier instead
+# of once per token; tiers are checked in priority order.
+_IMPLEMENTATION_BLOCKER_RE = re.compile(
+    r"(?:file|path|artifact_path)\s*=\s*[^|;\n]*?[/\\](?:scripts|data|src)[/\\]"
+    r"|(?:^|[\s|;,:])(?:scripts|data|src)/"
+    r"|launch_input_not_runnable|segment_list|\.mp4|media input"
+)
+_LAUNCH_BLOCKER_RE = re.compile(
+    r"launch|slurm|sbatch|squeue|sync|artifact_sync|job_id|run_manifest"
+)
+_EXTRACT_BLOCKER_RE = re.compile(r"extract|metrics|analysis|summary|aggregate|result")
+
+
+_BLOCKER_STAGE_HINTS = {
+    "implementation": "implementation",
+    "implementation_review": "implementation_review",
+    "launch": "launch",
+    "slurm_monitor": "launch",
+    "extract_results": "extract_results",
+}
+
+
 def _map_blocking_finding_stage(*, text: str, stage_hint: str) -> str:
-    normalized_hint = _normalize_space(stage_hint).lower()
-    if normalized_hint == "implementation":
-        return "implementation"
-    if normalized_hint == "implementation_review":
-        return "implementation_review"
-    if normalized_hint in {"launch", "slurm_monitor"}:
-        return "launch"
-    if normalized_hint == "extract_results":
-        return "extract_results"
+    hinted_stage = _BLOCKER_STAGE_HINTS.get(_normalize_space(stage_hint).lower())
+    if hinted_stage is not None:
+        return hinted_stage
 
     lowered = _normalize_space(text).lower()
-    if re.search(
-        r"(?:file|path|artifact_path)\s*=\s*[^|;\n]*?(?:/|\\)(?:scripts|data|src)(?:/|\\)",
-        lowered,
-    ):
+    if _IMPLEMENTATION_BLOCKER_RE.search(lowered):
         return "implementation"
-    if re.search(r"(^|[\s|;,:])(?:scripts|data|src)/", lowered):
-        return "implementation"
-    if any(
-        token in lowered
-        for token in (
-            "launch_input_not_runnable",
-            "segment_list",
-            ".mp4",
-            "media input",
-            "manual_check=launch_input_not_runnable",
-        )
-    ):
-        return "implementation"
-
-    launch_tokens = (
-        "launch",
-        "slurm",
-        "sbatch",
-        "squeue",
-        "sync",
-        "artifact_sync",
-        "job_id",
-        "run_manifest",
-    )
-    extract_tokens = (
-        "extract",
-        "metrics",
-        "analysis",
-        "summary",
-        "aggregate",
-        "result",
-    )
-    if any(token in lowered for token in launch_tokens):
+    if _LAUNCH_BLOCKER_RE.search(lowered):
         return "launch"
-    if any(token in lowered for token in extract_tokens):
+    if _EXTRACT_BLOCKER_RE.search(lowered):
         return "extract_results"
     return "implementation"
 
 
-def _blocker_data_root_hint(repo_root: Path, *, iteration_dir: Path, text: str) -> str:
+def _mentions_media_inputs(text: str) -> bool:
     lowered = _normalize_space(text).lower()
-    if not any(
+    return any(
         token in lowered
         for token in ("launch_input_not_runnable", "segment_list", ".mp4", "media")
-    ):
-        return ""
+    )
+
+
+def _blocker_data_root_hint(repo_root: Path, *, iteration_dir: Path) -> str:
     discovery = discover_media_inputs(repo_root, iteration_dir=iteration_dir)
     roots = ", ".join(str(path) for path in discovery.project_roots)
     if not roots:
@@ -962,6 +1101,8 @@ def _extract_review_blocker_candidates(
         return []
 
     candidates: list[_GeneratedCandidate] = []
+    # Media discovery walks the data roots; do it at most once per review.
+    media_hint: str | None = None
     for finding in findings:
         finding_text, stage_hint = _normalize_blocking_finding_text(finding)
         if not finding_text:
@@ -972,9 +1113,13 @@ def _extract_review_blocker_candidates(
         text_key = _normalize_text_key(finding_text)
         if not text_key:
             continue
-        data_root_hint = _blocker_data_root_hint(
-            repo_root, iteration_dir=iteration_dir, text=finding_text
-        )
+        data_root_hint = ""
+        if _mentions_media_inputs(finding_text):
+            if media_hint is None:
+                media_hint = _blocker_data_root_hint(
+                    repo_root, iteration_dir=iteration_dir
+                )
+            data_root_hint = media_hint
         blocker_text = (
             "Resolve implementation review blocker for iteration "
             f"{iteration_id}: {finding_text}"
@@ -1031,7 +1176,7 @@ def _collect_generated_candidates(
     backlog_path = repo_root / ".autolab" / "backlog.yaml"
     backlog_payload: dict[str, Any] | None = None
     iteration_is_completed = False
-    if backlog_path.exists() and yaml is not None:
+    if yaml is not None:
         try:
             parsed_backlog = yaml.safe_load(backlog_path.read_text(encoding="utf-8"))
         except Exception:
@@ -1196,12 +1341,14 @@ def _upsert_task(
     norm = _normalize_text_key(clean_text)
     task_id = _hash_task_id(source=source, scope=scope, stage=stage, text_key=norm)
     task_class = _classify_task(stage=stage, text=clean_text)
+    scope_class = _scope_class(source=source, scope=scope)
 
     if task_id not in tasks:
         tasks[task_id] = {
             "task_id": task_id,
             "source": source,
             "scope": scope,
+            "scope_class": scope_class,
             "stage": stage,
             "task_class": task_class,
             "text": clean_text,
@@ -1217,6 +1364,7 @@ def _upsert_task(
         task = tasks[task_id]
         task["source"] = source
         task["scope"] = scope
+        task["scope_class"] = scope_class
         task["stage"] = stage
         task["task_class"] = task_class
         task["text"] = clean_text
@@ -1311,7 +1459,7 @@ def _write_focus_snapshot(
     now: str,
     limit: int = 5,
 ) -> bool:
-    focus_path = repo_root / ".autolab" / "todo_focus.json"
+    focus_path = _todo_paths(repo_root).focus
     focus = [
         {
             "task_id": task.get("task_id", ""),
@@ -1363,19 +1511,15 @@ def _sync_internal(
         _normalize_space(str((state or {}).get("assistant_mode", ""))).lower() == "on"
     )
 
-    todo_path = repo_root / "docs" / "todo.md"
-    todo_state_path = repo_root / ".autolab" / "todo_state.json"
+    paths = _todo_paths(repo_root)
+    todo_path = paths.todo
+    todo_state_path = paths.state
 
     if not todo_path.exists():
         if _write_text_if_changed(todo_path, _default_todo_content()):
             changed_files.append(todo_path)
 
-    todo_text = (
-        todo_path.read_text(encoding="utf-8")
-        if todo_path.exists()
-        else _default_todo_content()
-    )
-    tasks_lines, notes_lines, _ = _extract_sections(todo_text)
+    tasks_lines, notes_lines, _ = _read_todo_sections(todo_path)
     parsed_bullets = _parse_bullets(tasks_lines)
 
     todo_state = _load_todo_state(todo_state_path)
@@ -1392,7 +1536,7 @@ def _sync_internal(
     has_open_generated_blocker_tasks = any(
         task.get("source") == "generated"
         and task.get("status") == "open"
-        and _is_blocker_scope(str(task.get("scope", "")))
+        and _task_scope_class(task) == "blocker"
         for task in tasks.values()
     )
     if current_stage != "decide_repeat":
@@ -1426,11 +1570,13 @@ def _sync_internal(
     generated_norm_stage = {
         (_normalize_text_key(item.text), item.stage) for item in generated_candidates
     }
-    existing_generated_norm_stage = {
-        (str(task.get("text_key", "")), str(task.get("stage", "")))
-        for task in tasks.values()
-        if task.get("source") == "generated" and task.get("status") == "open"
-    }
+    # Index open generated tasks once so echoed bullets resolve in O(1)
+    # instead of rescanning every task per bullet.
+    open_generated_by_key: dict[tuple[str, str], list[dict[str, Any]]] = {}
+    for task in tasks.values():
+        if task.get("source") == "generated" and task.get("status") == "open":
+            key = (str(task.get("text_key", "")), str(task.get("stage", "")))
+            open_generated_by_key.setdefault(key, []).append(task)
 
     seen_manual_ids: set[str] = set()
 
@@ -1443,21 +1589,12 @@ def _sync_internal(
         if not text_key:
             continue
 
-        is_generated_echo = (text_key, stage) in generated_norm_stage or (
-            text_key,
-            stage,
-        ) in existing_generated_norm_stage
-        if is_generated_echo:
+        echo_key = (text_key, stage)
+        if echo_key in generated_norm_stage or echo_key in open_generated_by_key:
             if parsed.checked:
-                for task in tasks.values():
-                    if (
-                        task.get("source") == "generated"
-                        and task.get("status") == "open"
-                        and task.get("stage") == stage
-                        and task.get("text_key") == text_key
-                    ):
-                        if _mark_completed(task, now):
-                            removed_count += 1
+                for task in open_generated_by_key.get(echo_key, ()):
+                    if _mark_completed(task, now):
+                        removed_count += 1
             continue
 
         manual_task_id = _upsert_task(
@@ -1574,13 +1711,13 @@ def _sync_internal(
     if _write_text_if_changed(todo_path, rendered):
         changed_files.append(todo_path)
 
-    if _write_json_if_changed(todo_state_path, todo_state):
+    if _write_todo_state_if_changed(todo_state_path, todo_state):
         changed_files.append(todo_state_path)
 
     if _write_focus_snapshot(
         repo_root, stage=current_stage, open_tasks=open_tasks, now=now
     ):
-        changed_files.append(repo_root / ".autolab" / "todo_focus.json")
+        changed_files.append(paths.focus)
 
     message = f"todo_sync open={len(open_tasks)} removed={removed_count}"
     return TodoSyncResult(
@@ -1618,7 +1755,7 @@ def _map_stage_to_decision(stage: str) -> str | None:
 def select_decision_from_todo(
     repo_root: Path, *, prioritize_implementation: bool = False
 ) -> str | None:
-    state_path = repo_root / ".autolab" / "todo_state.json"
+    state_path = _todo_paths(repo_root).state
     todo_state = _load_todo_state(state_path)
     open_tasks = _open_tasks_sorted(todo_state)
 
@@ -1650,7 +1787,7 @@ def select_decision_from_todo(
 def select_open_task(
     repo_root: Path, *, prioritize_implementation: bool = False
 ) -> dict[str, Any] | None:
-    state_path = repo_root / ".autolab" / "todo_state.json"
+    state_path = _todo_paths(repo_root).state
     todo_state = _load_todo_state(state_path)
     open_tasks = _open_tasks_sorted(todo_state)
     if not open_tasks:
@@ -1672,7 +1809,7 @@ def select_open_task(
 
 
 def list_open_tasks(repo_root: Path) -> list[dict[str, Any]]:
-    state_path = repo_root / ".autolab" / "todo_state.json"
+    state_path = _todo_paths(repo_root).state
     todo_state = _load_todo_state(state_path)
     open_tasks = _open_tasks_sorted(todo_state)
     return [
@@ -1697,8 +1834,9 @@ def _set_task_status(repo_root: Path, task_id: str, *, status: str) -> bool:
     normalized_status = _normalize_space(status).lower()
     if not normalized_id or normalized_status not in {"completed", "removed"}:
         return False
-    todo_state_path = repo_root / ".autolab" / "todo_state.json"
-    todo_path = repo_root / "docs" / "todo.md"
+    paths = _todo_paths(repo_root)
+    todo_state_path = paths.state
+    todo_path = paths.todo
     todo_state = _load_todo_state(todo_state_path)
     tasks = todo_state.get("tasks", {})
     if not isinstance(tasks, dict):
@@ -1718,13 +1856,8 @@ def _set_task_status(repo_root: Path, task_id: str, *, status: str) -> bool:
         task["status"] = normalized_status
         task["last_evidence_at"] = now
     _prune_non_open_tasks(todo_state)
-    _write_json_if_changed(todo_state_path, todo_state)
-    todo_text = (
-        todo_path.read_text(encoding="utf-8")
-        if todo_path.exists()
-        else _default_todo_content()
-    )
-    _, notes_lines, _ = _extract_sections(todo_text)
+    _write_todo_state_if_changed(todo_state_path, todo_state)
+    _, notes_lines, _ = _read_todo_sections(todo_path)
     open_tasks = _open_tasks_sorted(todo_state)
     rendered = _render_todo(open_tasks, notes_lines)
     _write_text_if_changed(todo_path, rendered)
@@ -1742,7 +1875,7 @@ def mark_task_removed(repo_root: Path, task_id: str) -> bool:
 def build_focus_tasks(
     repo_root: Path, stage: str, limit: int = 5
 ) -> list[dict[str, Any]]:
-    state_path = repo_root / ".autolab" / "todo_state.json"
+    state_path = _todo_paths(repo_root).state
     todo_state = _load_todo_state(state_path)
     open_tasks = _open_tasks_sorted(todo_state)
     target_stage = _normalize_stage(stage, "hypothesis")
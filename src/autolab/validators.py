@@ -970,6 +970,7 @@ def _persist_verification_result(
 
 
 def _persist_structured_verifier_results(
+    repo_root: Path,
     state: dict[str, Any],
     stage: str,
     results: list[dict[str, Any]],
@@ -983,7 +984,7 @@ def _persist_structured_verifier_results(
         if not iteration_id:
             return
         iteration_dir, _iteration_type = _resolve_iteration_directory(
-            Path.cwd(),
+            repo_root,
             iteration_id=iteration_id,
             experiment_id=experiment_id,
             require_exists=False,
@@ -1454,7 +1455,7 @@ def _run_verification_step_detailed(
                 message=message,
                 details=details,
             )
-            _persist_structured_verifier_results(state, stage, results)
+            _persist_structured_verifier_results(repo_root, state, stage, results)
             return (False, message, details)
 
     details = {
@@ -1474,7 +1475,7 @@ def _run_verification_step_detailed(
         message=message,
         details=details,
     )
-    _persist_structured_verifier_results(state, stage, results)
+    _persist_structured_verifier_results(repo_root, state, stage, results)
     return (True, message, details)
 
 
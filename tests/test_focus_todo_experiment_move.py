@@ -12,6 +12,10 @@ import yaml
 import autolab.commands as commands_module
 
 
+_SCAFFOLD_PYTHON_BIN = b"\npython_bin: python3\n"
+_TEST_PYTHON_BIN = f'\npython_bin: "{sys.executable}"\n'.encode("utf-8")
+
+
 def _copy_scaffold(repo: Path) -> None:
     source = (
         Path(__file__).resolve().parents[1]
@@ -24,12 +28,11 @@ def _copy_scaffold(repo: Path) -> None:
     shutil.copytree(source, target, dirs_exist_ok=True)
 
     policy_path = target / "verifier_policy.yaml"
-    policy_lines = policy_path.read_text(encoding="utf-8").splitlines()
-    for idx, line in enumerate(policy_lines):
-        if line.strip().startswith("python_bin:"):
-            policy_lines[idx] = f'python_bin: "{sys.executable}"'
-            break
-    policy_path.write_text("\n".join(policy_lines) + "\n", encoding="utf-8")
+    policy_bytes = policy_path.read_bytes()
+    assert _SCAFFOLD_PYTHON_BIN in policy_bytes
+    policy_path.write_bytes(
+        policy_bytes.replace(_SCAFFOLD_PYTHON_BIN, _TEST_PYTHON_BIN, 1)
+    )
 
 
 def _write_state(
@@ -1,19 +1,64 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
-
-import yaml
-
 import os
 import time
+from pathlib import Path
+from typing import Any
 
-from autolab.todo_sync import _map_blocking_finding_stage, sync_todo_pre_run
+import pytest
 
+from autolab.todo_sync import (
+    _load_todo_state as _load_todo_state_file,
+    _map_blocking_finding_stage,
+    _parse_bullets,
+    _read_todo_sections,
+    _task_scope_class,
+    sync_todo_pre_run,
+)
 
-def _write(path: Path, text: str) -> None:
+
+def _write(path: Path, text: str | bytes) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(text, encoding="utf-8")
+    path.write_bytes(text if isinstance(text, bytes) else text.encode("utf-8"))
+
+
+# One clock read per module: an hour back clears coarse mtime granularity and
+# stays older than any file a test writes afterwards.
+_BACKDATED_MTIME = time.time() - 3600
+
+
+def _backdate(path: Path) -> None:
+    os.utime(path, (_BACKDATED_MTIME, _BACKDATED_MTIME))
+
+
+def _load_todo_state(repo: Path) -> dict[str, Any]:
+    return json.loads((repo / ".autolab" / "todo_state.json").read_bytes())
+
+
+def _dump_json_bytes(payload: dict[str, object]) -> bytes:
+    return (json.dumps(payload, indent=2) + "\n").encode("utf-8")
+
+
+_EMPTY_TODO = b"# TODO\n\n## Tasks\n<!-- empty -->\n\n## Notes\nnotes\n"
+
+
+def _make_repo(tmp_path: Path, todo_text: str | bytes = _EMPTY_TODO) -> Path:
+    repo = tmp_path / "repo"
+    _write(repo / "docs" / "todo.md", todo_text)
+    return repo
+
+
+# Shared, never mutated: the seeder only writes it out.
+_BASE_REVIEW_RESULT: dict[str, object] = {
+    "required_checks": {
+        "tests": "pass",
+        "dry_run": "skip",
+        "schema": "pass",
+        "env_smoke": "skip",
+        "docs_target_update": "skip",
+    },
+}
 
 
 def _seed_review_result(
@@ -22,28 +67,22 @@ def _seed_review_result(
     iteration_id: str = "iter1",
     status: str = "needs_retry",
     blocking_findings: list[object] | None = None,
-) -> None:
+    reviewed_at: str = "2026-02-19T00:00:00Z",
+) -> Path:
     payload = {
+        **_BASE_REVIEW_RESULT,
         "status": status,
         "blocking_findings": blocking_findings or [],
-        "required_checks": {
-            "tests": "pass",
-            "dry_run": "skip",
-            "schema": "pass",
-            "env_smoke": "skip",
-            "docs_target_update": "skip",
-        },
-        "reviewed_at": "2026-02-19T00:00:00Z",
+        "reviewed_at": reviewed_at,
     }
     path = repo / "experiments" / "plan" / iteration_id / "review_result.json"
-    _write(path, json.dumps(payload, indent=2) + "\n")
+    _write(path, _dump_json_bytes(payload))
+    return path
 
 
 def test_todo_sync_parses_nested_and_wrapped_markdown_tasks(tmp_path: Path) -> None:
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    _write(
-        repo / "docs" / "todo.md",
+    repo = _make_repo(
+        tmp_path,
         (
             "# TODO\n\n"
             "## Tasks\n"
@@ -66,9 +105,7 @@ def test_todo_sync_parses_nested_and_wrapped_markdown_tasks(tmp_path: Path) -> N
     result = sync_todo_pre_run(repo, state, host_mode="local")
     assert result.open_count == 2
 
-    todo_state = json.loads(
-        (repo / ".autolab" / "todo_state.json").read_text(encoding="utf-8")
-    )
+    todo_state = _load_todo_state(repo)
     tasks = [
         task for task in todo_state["tasks"].values() if task.get("status") == "open"
     ]
@@ -83,12 +120,9 @@ def test_todo_sync_parses_nested_and_wrapped_markdown_tasks(tmp_path: Path) -> N
 
 
 def test_todo_sync_uses_policy_fallback_task_configuration(tmp_path: Path) -> None:
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    _write(
-        repo / "docs" / "todo.md",
-        ("# TODO\n\n## Tasks\n<!-- empty -->\n\n## Notes\nnotes\n"),
-    )
+    import yaml
+
+    repo = _make_repo(tmp_path)
     policy = {
         "autorun": {
             "todo_fallback": {
@@ -112,9 +146,7 @@ def test_todo_sync_uses_policy_fallback_task_configuration(tmp_path: Path) -> No
     }
     sync_todo_pre_run(repo, state, host_mode="local")
 
-    todo_state = json.loads(
-        (repo / ".autolab" / "todo_state.json").read_text(encoding="utf-8")
-    )
+    todo_state = _load_todo_state(repo)
     tasks = [
         task for task in todo_state["tasks"].values() if task.get("status") == "open"
     ]
@@ -129,12 +161,7 @@ def test_todo_sync_uses_policy_fallback_task_configuration(tmp_path: Path) -> No
 def test_todo_sync_extracts_generated_tasks_from_review_blockers(
     tmp_path: Path,
 ) -> None:
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    _write(
-        repo / "docs" / "todo.md",
-        ("# TODO\n\n## Tasks\n<!-- empty -->\n\n## Notes\nnotes\n"),
-    )
+    repo = _make_repo(tmp_path)
     _seed_review_result(
         repo,
         status="needs_retry",
@@ -152,18 +179,15 @@ def test_todo_sync_extracts_generated_tasks_from_review_blockers(
     }
     sync_todo_pre_run(repo, state, host_mode="local")
 
-    todo_state = json.loads(
-        (repo / ".autolab" / "todo_state.json").read_text(encoding="utf-8")
-    )
-    open_tasks = [
-        task for task in todo_state["tasks"].values() if task.get("status") == "open"
-    ]
+    todo_state = _load_todo_state(repo)
     blocker_tasks = [
         task
-        for task in open_tasks
-        if str(task.get("scope", "")).startswith("review:blocker:")
+        for task in todo_state["tasks"].values()
+        if task.get("status") == "open"
+        and task.get("scope", "").startswith("review:blocker:")
     ]
     assert blocker_tasks
+    assert all("scope_class" not in task for task in blocker_tasks)
     stages = {str(task.get("stage", "")) for task in blocker_tasks}
     assert "implementation" in stages
     assert "launch" in stages
@@ -173,12 +197,7 @@ def test_todo_sync_extracts_generated_tasks_from_review_blockers(
 def test_todo_sync_prefers_implementation_for_file_backed_blockers(
     tmp_path: Path,
 ) -> None:
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    _write(
-        repo / "docs" / "todo.md",
-        ("# TODO\n\n## Tasks\n<!-- empty -->\n\n## Notes\nnotes\n"),
-    )
+    repo = _make_repo(tmp_path)
     _seed_review_result(
         repo,
         status="needs_retry",
@@ -194,26 +213,19 @@ def test_todo_sync_prefers_implementation_for_file_backed_blockers(
     }
     sync_todo_pre_run(repo, state, host_mode="local")
 
-    todo_state = json.loads(
-        (repo / ".autolab" / "todo_state.json").read_text(encoding="utf-8")
-    )
+    todo_state = _load_todo_state(repo)
     blocker_tasks = [
         task
         for task in todo_state["tasks"].values()
         if task.get("status") == "open"
-        and str(task.get("scope", "")).startswith("review:blocker:")
+        and task.get("scope", "").startswith("review:blocker:")
     ]
     assert blocker_tasks
     assert any(str(task.get("stage", "")) == "implementation" for task in blocker_tasks)
 
 
 def test_todo_sync_parses_stage_hint_from_blocker_string(tmp_path: Path) -> None:
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    _write(
-        repo / "docs" / "todo.md",
-        ("# TODO\n\n## Tasks\n<!-- empty -->\n\n## Notes\nnotes\n"),
-    )
+    repo = _make_repo(tmp_path)
     _seed_review_result(
         repo,
         status="needs_retry",
@@ -229,14 +241,12 @@ def test_todo_sync_parses_stage_hint_from_blocker_string(tmp_path: Path) -> None
     }
     sync_todo_pre_run(repo, state, host_mode="local")
 
-    todo_state = json.loads(
-        (repo / ".autolab" / "todo_state.json").read_text(encoding="utf-8")
-    )
+    todo_state = _load_todo_state(repo)
     blocker_tasks = [
         task
         for task in todo_state["tasks"].values()
         if task.get("status") == "open"
-        and str(task.get("scope", "")).startswith("review:blocker:")
+        and task.get("scope", "").startswith("review:blocker:")
     ]
     assert blocker_tasks
     assert all(str(task.get("stage", "")) == "implementation" for task in blocker_tasks)
@@ -245,15 +255,8 @@ def test_todo_sync_parses_stage_hint_from_blocker_string(tmp_path: Path) -> None
 def test_todo_sync_maps_launch_input_not_runnable_to_implementation_with_data_hints(
     tmp_path: Path,
 ) -> None:
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    _write(
-        repo / "docs" / "todo.md",
-        ("# TODO\n\n## Tasks\n<!-- empty -->\n\n## Notes\nnotes\n"),
-    )
-    data_file = repo / "data" / "curated_yt_drummers" / "sample.mp4"
-    data_file.parent.mkdir(parents=True, exist_ok=True)
-    data_file.write_bytes(b"video")
+    repo = _make_repo(tmp_path)
+    _write(repo / "data" / "curated_yt_drummers" / "sample.mp4", b"video")
     _seed_review_result(
         repo,
         status="needs_retry",
@@ -269,14 +272,12 @@ def test_todo_sync_maps_launch_input_not_runnable_to_implementation_with_data_hi
     }
     sync_todo_pre_run(repo, state, host_mode="local")
 
-    todo_state = json.loads(
-        (repo / ".autolab" / "todo_state.json").read_text(encoding="utf-8")
-    )
+    todo_state = _load_todo_state(repo)
     blocker_tasks = [
         task
         for task in todo_state["tasks"].values()
         if task.get("status") == "open"
-        and str(task.get("scope", "")).startswith("review:blocker:")
+        and task.get("scope", "").startswith("review:blocker:")
     ]
     assert blocker_tasks
     assert all(str(task.get("stage", "")) == "implementation" for task in blocker_tasks)
@@ -287,12 +288,7 @@ def test_todo_sync_maps_launch_input_not_runnable_to_implementation_with_data_hi
 
 
 def test_todo_sync_filters_non_actionable_blocker_meta_lines(tmp_path: Path) -> None:
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    _write(
-        repo / "docs" / "todo.md",
-        ("# TODO\n\n## Tasks\n<!-- empty -->\n\n## Notes\nnotes\n"),
-    )
+    repo = _make_repo(tmp_path)
     _seed_review_result(
         repo,
         status="needs_retry",
@@ -309,14 +305,12 @@ def test_todo_sync_filters_non_actionable_blocker_meta_lines(tmp_path: Path) ->
     }
     sync_todo_pre_run(repo, state, host_mode="local")
 
-    todo_state = json.loads(
-        (repo / ".autolab" / "todo_state.json").read_text(encoding="utf-8")
-    )
+    todo_state = _load_todo_state(repo)
     blocker_texts = [
         str(task.get("text", ""))
         for task in todo_state["tasks"].values()
         if task.get("status") == "open"
-        and str(task.get("scope", "")).startswith("review:blocker:")
+        and task.get("scope", "").startswith("review:blocker:")
     ]
     assert blocker_texts
     assert not any("verifier_failing_checks=none" in text for text in blocker_texts)
@@ -325,12 +319,7 @@ def test_todo_sync_filters_non_actionable_blocker_meta_lines(tmp_path: Path) ->
 def test_todo_sync_skips_fallback_when_unresolved_review_blockers_exist(
     tmp_path: Path,
 ) -> None:
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    _write(
-        repo / "docs" / "todo.md",
-        ("# TODO\n\n## Tasks\n<!-- empty -->\n\n## Notes\nnotes\n"),
-    )
+    repo = _make_repo(tmp_path)
     _seed_review_result(
         repo,
         status="needs_retry",
@@ -344,17 +333,15 @@ def test_todo_sync_skips_fallback_when_unresolved_review_blockers_exist(
     }
     sync_todo_pre_run(repo, state, host_mode="local")
 
-    todo_state = json.loads(
-        (repo / ".autolab" / "todo_state.json").read_text(encoding="utf-8")
-    )
+    todo_state = _load_todo_state(repo)
     open_tasks = [
         task for task in todo_state["tasks"].values() if task.get("status") == "open"
     ]
     assert any(
-        str(task.get("scope", "")).startswith("review:blocker:") for task in open_tasks
+        task.get("scope", "").startswith("review:blocker:") for task in open_tasks
     )
     assert not any(
-        str(task.get("scope", "")).startswith("policy:no_task_fallback:")
+        task.get("scope", "").startswith("policy:no_task_fallback:")
         for task in open_tasks
     )
 
@@ -362,10 +349,8 @@ def test_todo_sync_skips_fallback_when_unresolved_review_blockers_exist(
 def test_todo_sync_keeps_manual_blocker_tasks_sticky_with_unresolved_blockers(
     tmp_path: Path,
 ) -> None:
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    _write(
-        repo / "docs" / "todo.md",
+    repo = _make_repo(
+        tmp_path,
         (
             "# TODO\n\n## Tasks\n"
             "- [ ] [stage:implementation] Fix blocker in scripts/method.py\n\n"
@@ -384,15 +369,10 @@ def test_todo_sync_keeps_manual_blocker_tasks_sticky_with_unresolved_blockers(
     }
     sync_todo_pre_run(repo, state, host_mode="local")
 
-    _write(
-        repo / "docs" / "todo.md",
-        "# TODO\n\n## Tasks\n<!-- empty -->\n\n## Notes\nnotes\n",
-    )
+    _write(repo / "docs" / "todo.md", _EMPTY_TODO)
     sync_todo_pre_run(repo, state, host_mode="local")
 
-    todo_state = json.loads(
-        (repo / ".autolab" / "todo_state.json").read_text(encoding="utf-8")
-    )
+    todo_state = _load_todo_state(repo)
     assert any(
         task.get("source") == "manual"
         and task.get("status") == "open"
@@ -411,12 +391,7 @@ def test_stale_review_emits_rerun_task_instead_of_individual_blockers(
 ) -> None:
     """When implementation artifacts are newer than review_result.json, emit a
     single 'rerun review' task rather than individual blocker tasks."""
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    _write(
-        repo / "docs" / "todo.md",
-        "# TODO\n\n## Tasks\n<!-- empty -->\n\n## Notes\nnotes\n",
-    )
+    repo = _make_repo(tmp_path)
 
     # Write review_result.json first
     _seed_review_result(
@@ -425,18 +400,11 @@ def test_stale_review_emits_rerun_task_instead_of_individual_blockers(
         blocking_findings=["Fix parser bug in scripts/method.py"],
     )
 
-    # Create a script file that is newer than the review result
     iteration_dir = repo / "experiments" / "plan" / "iter1"
-    script_file = iteration_dir / "scripts" / "method.py"
-    script_file.parent.mkdir(parents=True, exist_ok=True)
-
-    # Ensure the review_result has an older mtime
-    review_result_path = iteration_dir / "review_result.json"
-    old_time = time.time() - 100
-    os.utime(review_result_path, (old_time, old_time))
+    _write(iteration_dir / "scripts" / "method.py", b"# fixed\n")
 
-    # Now create the script (will have a newer mtime)
-    script_file.write_text("# fixed\n", encoding="utf-8")
+    # Backdate the review_result so the script is unambiguously newer.
+    _backdate(iteration_dir / "review_result.json")
 
     state = {
         "iteration_id": "iter1",
@@ -445,16 +413,12 @@ def test_stale_review_emits_rerun_task_instead_of_individual_blockers(
     }
     sync_todo_pre_run(repo, state, host_mode="local")
 
-    todo_state = json.loads(
-        (repo / ".autolab" / "todo_state.json").read_text(encoding="utf-8")
-    )
-    open_tasks = [
-        task for task in todo_state["tasks"].values() if task.get("status") == "open"
-    ]
+    todo_state = _load_todo_state(repo)
     blocker_tasks = [
         task
-        for task in open_tasks
-        if str(task.get("scope", "")).startswith("review:blocker:")
+        for task in todo_state["tasks"].values()
+        if task.get("status") == "open"
+        and task.get("scope", "").startswith("review:blocker:")
     ]
     assert len(blocker_tasks) == 1
     assert blocker_tasks[0]["scope"] == "review:blocker:stale_review"
@@ -464,20 +428,13 @@ def test_stale_review_emits_rerun_task_instead_of_individual_blockers(
 def test_fresh_review_emits_normal_blockers(tmp_path: Path) -> None:
     """When review_result.json is newer than implementation artifacts, emit
     individual blocker tasks as usual."""
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    _write(
-        repo / "docs" / "todo.md",
-        "# TODO\n\n## Tasks\n<!-- empty -->\n\n## Notes\nnotes\n",
-    )
+    repo = _make_repo(tmp_path)
 
     iteration_dir = repo / "experiments" / "plan" / "iter1"
     # Create a script file first (older)
     script_file = iteration_dir / "scripts" / "method.py"
-    script_file.parent.mkdir(parents=True, exist_ok=True)
-    script_file.write_text("# code\n", encoding="utf-8")
-    old_time = time.time() - 100
-    os.utime(script_file, (old_time, old_time))
+    _write(script_file, b"# code\n")
+    _backdate(script_file)
 
     # Write review_result.json after (newer)
     _seed_review_result(
@@ -493,14 +450,12 @@ def test_fresh_review_emits_normal_blockers(tmp_path: Path) -> None:
     }
     sync_todo_pre_run(repo, state, host_mode="local")
 
-    todo_state = json.loads(
-        (repo / ".autolab" / "todo_state.json").read_text(encoding="utf-8")
-    )
+    todo_state = _load_todo_state(repo)
     blocker_tasks = [
         task
         for task in todo_state["tasks"].values()
         if task.get("status") == "open"
-        and str(task.get("scope", "")).startswith("review:blocker:")
+        and task.get("scope", "").startswith("review:blocker:")
     ]
     assert blocker_tasks
     # Should NOT be the stale_review task
@@ -511,31 +466,20 @@ def test_stale_review_skips_epoch_placeholder(tmp_path: Path) -> None:
     """When reviewed_at is the scaffold placeholder '1970-01-01T00:00:00Z',
     freshness check is skipped, so normal blockers are emitted even if
     scripts/ files are newer."""
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    _write(
-        repo / "docs" / "todo.md",
-        "# TODO\n\n## Tasks\n<!-- empty -->\n\n## Notes\nnotes\n",
-    )
+    repo = _make_repo(tmp_path)
 
     iteration_dir = repo / "experiments" / "plan" / "iter1"
-    review_result_path = iteration_dir / "review_result.json"
-    review_result_path.parent.mkdir(parents=True, exist_ok=True)
-    payload = {
-        "status": "needs_retry",
-        "blocking_findings": ["Fix parser bug in scripts/method.py"],
-        "required_checks": {},
-        "reviewed_at": "1970-01-01T00:00:00Z",
-    }
-    _write(review_result_path, json.dumps(payload, indent=2) + "\n")
+    review_result_path = _seed_review_result(
+        repo,
+        status="needs_retry",
+        blocking_findings=["Fix parser bug in scripts/method.py"],
+        reviewed_at="1970-01-01T00:00:00Z",
+    )
 
-    # Make review old and scripts newer
-    old_time = time.time() - 100
-    os.utime(review_result_path, (old_time, old_time))
+    _write(iteration_dir / "scripts" / "method.py", b"# newer\n")
 
-    script_file = iteration_dir / "scripts" / "method.py"
-    script_file.parent.mkdir(parents=True, exist_ok=True)
-    script_file.write_text("# newer\n", encoding="utf-8")
+    # Make review old and scripts newer
+    _backdate(review_result_path)
 
     state = {
         "iteration_id": "iter1",
@@ -544,14 +488,12 @@ def test_stale_review_skips_epoch_placeholder(tmp_path: Path) -> None:
     }
     sync_todo_pre_run(repo, state, host_mode="local")
 
-    todo_state = json.loads(
-        (repo / ".autolab" / "todo_state.json").read_text(encoding="utf-8")
-    )
+    todo_state = _load_todo_state(repo)
     blocker_tasks = [
         task
         for task in todo_state["tasks"].values()
         if task.get("status") == "open"
-        and str(task.get("scope", "")).startswith("review:blocker:")
+        and task.get("scope", "").startswith("review:blocker:")
     ]
     assert blocker_tasks
     # Should emit normal blockers, not the stale_review sentinel
@@ -561,12 +503,7 @@ def test_stale_review_skips_epoch_placeholder(tmp_path: Path) -> None:
 def test_stale_review_handles_missing_dirs_gracefully(tmp_path: Path) -> None:
     """When scripts/ and data/ directories don't exist, the freshness check
     falls through to normal blocker emission."""
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    _write(
-        repo / "docs" / "todo.md",
-        "# TODO\n\n## Tasks\n<!-- empty -->\n\n## Notes\nnotes\n",
-    )
+    repo = _make_repo(tmp_path)
 
     _seed_review_result(
         repo,
@@ -582,14 +519,12 @@ def test_stale_review_handles_missing_dirs_gracefully(tmp_path: Path) -> None:
     }
     sync_todo_pre_run(repo, state, host_mode="local")
 
-    todo_state = json.loads(
-        (repo / ".autolab" / "todo_state.json").read_text(encoding="utf-8")
-    )
+    todo_state = _load_todo_state(repo)
     blocker_tasks = [
         task
         for task in todo_state["tasks"].values()
         if task.get("status") == "open"
-        and str(task.get("scope", "")).startswith("review:blocker:")
+        and task.get("scope", "").startswith("review:blocker:")
     ]
     assert blocker_tasks
     # Normal blockers, not stale
@@ -601,20 +536,100 @@ def test_stale_review_handles_missing_dirs_gracefully(tmp_path: Path) -> None:
 # ===========================================================================
 
 
-def test_map_blocking_finding_stage_preserves_implementation_review() -> None:
-    result = _map_blocking_finding_stage(
-        text="some finding", stage_hint="implementation_review"
+@pytest.mark.parametrize(
+    "stage_hint",
+    ["implementation_review", "implementation", "launch"],
+)
+def test_map_blocking_finding_stage_preserves_stage_hint(stage_hint: str) -> None:
+    result = _map_blocking_finding_stage(text="some finding", stage_hint=stage_hint)
+    assert result == stage_hint
+
+
+def test_load_todo_state_recomputes_stale_scope_class(tmp_path: Path) -> None:
+    state_path = tmp_path / "todo_state.json"
+    _write(
+        state_path,
+        json.dumps(
+            {
+                "version": 1,
+                "next_order": 3,
+                "tasks": {
+                    "t1": {
+                        "source": "generated",
+                        "scope": "review:blocker:abc",
+                        "scope_class": "other",
+                    },
+                    "t2": {
+                        "source": "manual",
+                        "scope": "manual",
+                        "scope_class": "blocker",
+                    },
+                },
+            }
+        ),
     )
-    assert result == "implementation_review"
+
+    tasks = _load_todo_state_file(state_path)["tasks"]
+
+    assert _task_scope_class(tasks["t1"]) == "blocker"
+    assert _task_scope_class(tasks["t2"]) == "manual"
+
+
+def _bullet_texts(lines: list[str]) -> list[tuple[str, bool]]:
+    return [(bullet.text, bullet.checked) for bullet in _parse_bullets(lines)]
+
+
+def test_parse_bullets_accepts_numbered_items_with_any_decimal_digits() -> None:
+    lines = ["1. first", "2) second", "\u0661. arabic-indic", "10.no space"]
+
+    assert _bullet_texts(lines) == [
+        ("first", False),
+        ("second", False),
+        ("arabic-indic 10.no space", False),
+    ]
 
 
-def test_map_blocking_finding_stage_preserves_implementation() -> None:
-    result = _map_blocking_finding_stage(
-        text="some finding", stage_hint="implementation"
+def test_parse_bullets_folds_tab_indented_items_into_parent() -> None:
+    lines = ["- parent", "\t- child", "\tcontinued", "- sibling"]
+
+    assert _bullet_texts(lines) == [
+        ("parent child continued", False),
+        ("sibling", False),
+    ]
+
+
+def test_parse_bullets_skips_multiline_html_comments() -> None:
+    lines = ["<!--", "- hidden", "-->", "- visible", "<!-- inline -->", "- after"]
+
+    assert _bullet_texts(lines) == [("visible", False), ("after", False)]
+
+
+def test_parse_bullets_reads_checkbox_state() -> None:
+    lines = ["- [X] done upper", "- [x] done lower", "- [ ] open", "- [y] other"]
+
+    assert _bullet_texts(lines) == [
+        ("done upper", True),
+        ("done lower", True),
+        ("open", False),
+        ("[y] other", False),
+    ]
+
+
+def test_parse_bullets_treats_bare_dash_as_continuation_text() -> None:
+    lines = ["- first", "-", "- ", "- second"]
+
+    assert _bullet_texts(lines) == [("first -", False), ("second", False)]
+
+
+def test_read_todo_sections_keeps_str_splitlines_boundaries(tmp_path: Path) -> None:
+    todo_path = tmp_path / "todo.md"
+    _write(
+        todo_path,
+        "# TODO\n\n## Tasks\n- [ ] first\u2028- [ ] second\f\n## Notes\nnote\x85more\n",
     )
-    assert result == "implementation"
 
+    tasks_lines, notes_lines, seen_tasks = _read_todo_sections(todo_path)
 
-def test_map_blocking_finding_stage_falls_through_for_other_hints() -> None:
-    result = _map_blocking_finding_stage(text="some finding", stage_hint="launch")
-    assert result == "launch"
+    assert seen_tasks is True
+    assert tasks_lines == ["- [ ] first", "- [ ] second", ""]
+    assert notes_lines == ["note", "more"]
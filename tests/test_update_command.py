@@ -9,6 +9,11 @@ import autolab.update as update_module
 from autolab.__main__ import _build_parser
 
 
+@pytest.fixture(scope="session")
+def help_text() -> str:
+    return _build_parser().format_help()
+
+
 def _completed_process(
     *,
     returncode: int = 0,
@@ -82,8 +87,7 @@ def test_build_git_install_spec_uses_exact_git_url() -> None:
     )
 
 
-def test_update_command_is_listed_in_help() -> None:
-    help_text = _build_parser().format_help()
+def test_update_command_is_listed_in_help(help_text: str) -> None:
     assert "update" in help_text
 
 
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import importlib.util
+import os
 import sys
 from pathlib import Path
 from types import ModuleType
 
+import pytest
+
 
 def _exec_module(path: Path, module_name: str) -> ModuleType:
     spec = importlib.util.spec_from_file_location(module_name, path)
@@ -12,6 +15,8 @@ def _exec_module(path: Path, module_name: str) -> ModuleType:
     assert spec.loader is not None
     module = importlib.util.module_from_spec(spec)
     sys.modules[module_name] = module
+    # Execute eagerly: the module-level imports (verifier_lib, autolab.*) are
+    # exactly what this test checks, so a LazyLoader would assert nothing.
     try:
         spec.loader.exec_module(module)
     except Exception:
@@ -20,21 +25,26 @@ def _exec_module(path: Path, module_name: str) -> ModuleType:
     return module
 
 
-def test_scaffold_verifiers_are_importable_via_spec() -> None:
-    verifiers_dir = (
-        Path(__file__).resolve().parents[1]
-        / "src"
-        / "autolab"
-        / "scaffold"
-        / ".autolab"
-        / "verifiers"
-    )
-    scripts = sorted(
-        path for path in verifiers_dir.glob("*.py") if path.stem != "verifier_lib"
-    )
-    assert scripts, "expected scaffold verifier scripts"
-
-    for idx, script in enumerate(scripts):
-        module_name = f"autolab_scaffold_verifier_{idx}_{script.stem}"
-        module = _exec_module(script, module_name)
-        assert module is not None
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_SCAFFOLD_DIR = _REPO_ROOT / "src" / "autolab" / "scaffold" / ".autolab"
+_VERIFIERS_DIR = _SCAFFOLD_DIR / "verifiers"
+with os.scandir(_VERIFIERS_DIR) as _entries:
+    _SCRIPTS = [
+        _VERIFIERS_DIR / name
+        for name in sorted(
+            entry.name
+            for entry in _entries
+            if entry.name.endswith(".py") and entry.name != "verifier_lib.py"
+        )
+    ]
+
+
+def test_scaffold_verifier_scripts_are_discovered() -> None:
+    assert _SCRIPTS, "expected scaffold verifier scripts"
+
+
+@pytest.mark.parametrize("script", _SCRIPTS, ids=lambda path: path.stem)
+def test_scaffold_verifiers_are_importable_via_spec(script: Path) -> None:
+    module_name = f"autolab_scaffold_verifier_{script.stem}"
+    module = _exec_module(script, module_name)
+    assert module is not None
@@ -1,61 +1,118 @@
 from __future__ import annotations
 
+import contextlib
 import importlib.util
+import io
 import json
+import os
+import runpy
 import shutil
+import subprocess
 import sys
+import tempfile
 import time
 from types import SimpleNamespace
+from typing import Any
 from pathlib import Path
 
 import pytest
-import yaml
 
 import autolab.commands as commands_module
+import autolab.validators as validators_module
+from autolab.cli.support import VERIFICATION_SUMMARY_RETENTION_LIMIT
 from autolab.validators import (
     _build_verification_command_specs,
     _run_verification_step_detailed,
 )
 
 
-def _copy_scaffold(repo: Path) -> None:
-    source = (
-        Path(__file__).resolve().parents[1]
-        / "src"
-        / "autolab"
-        / "scaffold"
-        / ".autolab"
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_SCAFFOLD_DIR = _REPO_ROOT / "src" / "autolab" / "scaffold" / ".autolab"
+_SCAFFOLD_PYTHON_BIN = b"\npython_bin: python3\n"
+_TEST_PYTHON_BIN = f'\npython_bin: "{sys.executable}"\n'.encode("utf-8")
+_RETENTION_LIMIT = VERIFICATION_SUMMARY_RETENTION_LIMIT
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _build_scaffold_cache(cache: Path) -> None:
+    # python_bin is patched once here; parser_fixtures only feeds
+    # `autolab parser`, which no test here runs.
+    shutil.copytree(
+        _SCAFFOLD_DIR, cache, ignore=shutil.ignore_patterns("parser_fixtures")
+    )
+    policy_path = cache / "verifier_policy.yaml"
+    policy_bytes = policy_path.read_bytes()
+    assert _SCAFFOLD_PYTHON_BIN in policy_bytes
+    policy_path.write_bytes(
+        policy_bytes.replace(_SCAFFOLD_PYTHON_BIN, _TEST_PYTHON_BIN, 1)
     )
-    target = repo / ".autolab"
-    shutil.copytree(source, target, dirs_exist_ok=True)
-    policy_path = target / "verifier_policy.yaml"
-    policy_lines = policy_path.read_text(encoding="utf-8").splitlines()
-    for idx, line in enumerate(policy_lines):
-        if line.strip().startswith("python_bin:"):
-            policy_lines[idx] = f'python_bin: "{sys.executable}"'
-            break
-    policy_path.write_text("\n".join(policy_lines) + "\n", encoding="utf-8")
-
-
-def _write_state(repo: Path) -> Path:
-    state = {
-        "iteration_id": "iter1",
-        "experiment_id": "e1",
-        "stage": "design",
-        "stage_attempt": 0,
-        "last_run_id": "",
-        "sync_status": "na",
-        "max_stage_attempts": 3,
-        "max_total_iterations": 20,
-    }
-    path = repo / ".autolab" / "state.json"
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(state, indent=2), encoding="utf-8")
-    return path
 
 
-def _write_backlog(repo: Path) -> None:
-    backlog = {
+@pytest.fixture(scope="session")
+def scaffold_cache(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    base = tmp_path_factory.getbasetemp()
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        # xdist workers get sibling basetemps under one per-run directory, so
+        # the cache is staged there and built once for all workers.
+        base = base.parent
+    published = base / "verify_scaffold_cache"
+    if not published.is_dir():
+        staging = Path(tempfile.mkdtemp(prefix="verify_scaffold_", dir=base))
+        _build_scaffold_cache(staging / ".autolab")
+        try:
+            # Atomic publish: a worker that loses the race discards its copy.
+            os.rename(staging, published)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+    return published / ".autolab"
+
+
+def _load_json(path: Path) -> Any:
+    return json.loads(path.read_bytes())
+
+
+def _copy_scaffold(repo: Path, scaffold_cache: Path) -> None:
+    # Hardlink from the session cache; any scaffold file a test rewrites must
+    # be unlinked first so the shared inode is never modified. A plain walk
+    # skips copytree's per-entry copystat, which the clone does not need.
+    src_root = str(scaffold_cache)
+    dst_root = str(repo / ".autolab")
+    for dirpath, _dirnames, filenames in os.walk(src_root):
+        dst_dir = dst_root + dirpath[len(src_root) :]
+        os.makedirs(dst_dir, exist_ok=True)
+        for filename in filenames:
+            _link_or_copy(
+                os.path.join(dirpath, filename), os.path.join(dst_dir, filename)
+            )
+
+
+def _compact_json_bytes(payload: dict[str, Any]) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+# Static fixture payloads, encoded once and written verbatim by the helpers
+# below. backlog.yaml and design.yaml are JSON, which YAML loads as-is.
+_STATE_PAYLOAD: dict[str, Any] = {
+    "iteration_id": "iter1",
+    "experiment_id": "e1",
+    "stage": "design",
+    "stage_attempt": 0,
+    "last_run_id": "",
+    "sync_status": "na",
+    "max_stage_attempts": 3,
+    "max_total_iterations": 20,
+}
+_STATE_BYTES = _compact_json_bytes(_STATE_PAYLOAD)
+_BACKLOG_BYTES = _compact_json_bytes(
+    {
         "hypotheses": [
             {
                 "id": "h1",
@@ -74,23 +131,17 @@ def _write_backlog(repo: Path) -> None:
             }
         ],
     }
-    path = repo / ".autolab" / "backlog.yaml"
-    path.write_text(yaml.safe_dump(backlog, sort_keys=False), encoding="utf-8")
-
-
-def _write_agent_result(repo: Path) -> None:
-    payload = {
+)
+_AGENT_RESULT_BYTES = _compact_json_bytes(
+    {
         "status": "complete",
         "summary": "ok",
         "changed_files": [],
         "completion_token_seen": True,
     }
-    path = repo / ".autolab" / "agent_result.json"
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-
-
-def _write_design(repo: Path) -> None:
-    payload = {
+)
+_DESIGN_BYTES = _compact_json_bytes(
+    {
         "schema_version": "1.0",
         "id": "e1",
         "iteration_id": "iter1",
@@ -119,24 +170,150 @@ def _write_design(repo: Path) -> None:
         },
         "variants": [{"name": "proposed", "changes": {}}],
     }
+)
+
+
+def _write_state(repo: Path, **overrides: Any) -> Path:
+    path = repo / ".autolab" / "state.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if overrides:
+        path.write_bytes(_compact_json_bytes({**_STATE_PAYLOAD, **overrides}))
+    else:
+        path.write_bytes(_STATE_BYTES)
+    return path
+
+
+def _write_backlog(repo: Path) -> None:
+    (repo / ".autolab" / "backlog.yaml").write_bytes(_BACKLOG_BYTES)
+
+
+def _write_agent_result(repo: Path) -> None:
+    (repo / ".autolab" / "agent_result.json").write_bytes(_AGENT_RESULT_BYTES)
+
+
+def _write_design(repo: Path) -> None:
     path = repo / "experiments" / "plan" / "iter1" / "design.yaml"
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(yaml.safe_dump(payload, sort_keys=False), encoding="utf-8")
+    path.write_bytes(_DESIGN_BYTES)
+
+
+def _run_verifier_in_process(
+    argv: list[str], *, cwd: Path
+) -> subprocess.CompletedProcess[str]:
+    # verifier_lib derives REPO_ROOT from its own path at import, so verifier
+    # modules already loaded from another tree are set aside, and every module
+    # and sys.path entry the script adds is dropped afterwards.
+    stale_verifier_modules = {
+        name: module
+        for name, module in sys.modules.items()
+        if Path(getattr(module, "__file__", None) or "").parent.parts[-2:]
+        == (".autolab", "verifiers")
+    }
+    for name in stale_verifier_modules:
+        del sys.modules[name]
+    saved_modules = set(sys.modules)
+    saved_path = list(sys.path)
+    saved_argv = sys.argv
+    saved_cwd = os.getcwd()
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    try:
+        os.chdir(cwd)
+        sys.argv = argv[1:]
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                runpy.run_path(argv[1], run_name="__main__")
+            except SystemExit as exc:
+                code = exc.code
+                if code is None:
+                    returncode = 0
+                elif isinstance(code, int):
+                    returncode = code
+                else:
+                    print(code, file=sys.stderr)
+                    returncode = 1
+    finally:
+        os.chdir(saved_cwd)
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+        for name in set(sys.modules) - saved_modules:
+            del sys.modules[name]
+        sys.modules.update(stale_verifier_modules)
+    return subprocess.CompletedProcess(
+        argv, returncode, stdout=stdout.getvalue(), stderr=stderr.getvalue()
+    )
 
 
-def _seed_verification_summaries(repo: Path, *, count: int) -> list[str]:
-    logs_dir = repo / ".autolab" / "logs"
+@pytest.fixture
+def in_process_verifiers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run scaffold verifier scripts in this interpreter instead of spawning
+    ``python_bin`` per verifier; other commands still go to ``subprocess``."""
+
+    real_run = subprocess.run
+
+    def _run(argv: Any, *args: Any, **kwargs: Any) -> Any:
+        if (
+            isinstance(argv, list)
+            and len(argv) >= 2
+            and argv[0] == sys.executable
+            and argv[1].startswith(".autolab/verifiers/")
+            and kwargs.get("env") is None
+        ):
+            return _run_verifier_in_process(argv, cwd=Path(kwargs["cwd"]))
+        return real_run(argv, *args, **kwargs)
+
+    # Copy the real module's namespace so every other subprocess attribute
+    # (PIPE, CalledProcessError, ...) stays reachable from validators.
+    monkeypatch.setattr(
+        validators_module,
+        "subprocess",
+        SimpleNamespace(**{**vars(subprocess), "run": _run}),
+    )
+
+
+@pytest.fixture
+def prepared_repo(tmp_path: Path, scaffold_cache: Path) -> tuple[Path, Path]:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _copy_scaffold(repo, scaffold_cache)
+    state_path = _write_state(repo)
+    _write_backlog(repo)
+    _write_agent_result(repo)
+    _write_design(repo)
+    return (repo, state_path)
+
+
+def _seed_verification_summaries(logs_dir: Path, *, count: int) -> list[str]:
     logs_dir.mkdir(parents=True, exist_ok=True)
     names: list[str] = []
-    for idx in range(count):
-        name = f"verification_00000000000000{idx:03d}_design.json"
-        (logs_dir / name).write_text(
-            json.dumps({"seed_index": idx}, indent=2) + "\n", encoding="utf-8"
-        )
-        names.append(name)
+    # Create every file relative to one directory fd to skip per-file Path
+    # objects and the buffered file wrapper.
+    dir_fd = os.open(logs_dir, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for idx in range(count):
+            name = f"verification_00000000000000{idx:03d}_design.json"
+            fd = os.open(
+                name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=dir_fd
+            )
+            try:
+                os.write(fd, b'{"seed_index":%d}' % idx)
+            finally:
+                os.close(fd)
+            names.append(name)
+    finally:
+        os.close(dir_fd)
     return names
 
 
+def _list_summary_names(logs_dir: Path) -> set[str]:
+    with os.scandir(logs_dir) as entries:
+        return {
+            entry.name
+            for entry in entries
+            if entry.name.startswith("verification_") and entry.name.endswith(".json")
+        }
+
+
 def _write_lock(repo: Path, *, state_path: Path, command: str = "autolab run") -> Path:
     now = commands_module._utc_now()
     payload = {
@@ -150,118 +327,120 @@ def _write_lock(repo: Path, *, state_path: Path, command: str = "autolab run") -
     }
     lock_path = repo / ".autolab" / "lock"
     lock_path.parent.mkdir(parents=True, exist_ok=True)
-    lock_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    lock_path.write_bytes(_compact_json_bytes(payload))
     return lock_path
 
 
-def test_verify_command_writes_summary_artifact(tmp_path: Path) -> None:
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    _copy_scaffold(repo)
-    state_path = _write_state(repo)
-    _write_backlog(repo)
-    _write_agent_result(repo)
-    _write_design(repo)
+def test_verify_command_writes_summary_artifact(
+    prepared_repo: tuple[Path, Path], in_process_verifiers: None
+) -> None:
+    repo, state_path = prepared_repo
 
     exit_code = commands_module.main(["verify", "--state-file", str(state_path)])
 
     assert exit_code == 0
-    summaries = sorted((repo / ".autolab" / "logs").glob("verification_*.json"))
-    assert summaries, "expected verification summary artifact"
-    latest = json.loads(summaries[-1].read_text(encoding="utf-8"))
+    logs_dir = repo / ".autolab" / "logs"
+    summary_names = _list_summary_names(logs_dir)
+    assert summary_names, "expected verification summary artifact"
+    latest = _load_json(logs_dir / max(summary_names))
     assert latest["passed"] is True
     assert latest["stage_effective"] == "design"
-    canonical = json.loads(
-        (repo / ".autolab" / "verification_result.json").read_text(encoding="utf-8")
-    )
+    canonical = _load_json(repo / ".autolab" / "verification_result.json")
     assert canonical["passed"] is True
     assert canonical["stage_effective"] == "design"
-    handoff_payload = json.loads(
-        (repo / ".autolab" / "handoff.json").read_text(encoding="utf-8")
-    )
+    handoff_payload = _load_json(repo / ".autolab" / "handoff.json")
     assert handoff_payload["current_stage"] == "design"
     handoff_md_path = Path(handoff_payload["handoff_markdown_path"])
     assert handoff_md_path.exists()
+    # Structured verifier outputs land in the repo, not the process cwd.
+    verification_dir = repo / "experiments" / "plan" / "iter1" / "verification"
+    assert any(verification_dir.glob("design_*.json"))
 
 
-def test_verify_command_prunes_old_summary_artifacts(tmp_path: Path) -> None:
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    _copy_scaffold(repo)
-    state_path = _write_state(repo)
-    _write_backlog(repo)
-    _write_agent_result(repo)
-    _write_design(repo)
-    seeded_names = _seed_verification_summaries(repo, count=205)
+def test_verify_command_writes_verifier_outputs_under_repo_from_other_cwd(
+    prepared_repo: tuple[Path, Path],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo, state_path = prepared_repo
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
 
     exit_code = commands_module.main(["verify", "--state-file", str(state_path)])
 
     assert exit_code == 0
-    summaries = sorted((repo / ".autolab" / "logs").glob("verification_*.json"))
-    assert len(summaries) == 200
-    remaining_names = {path.name for path in summaries}
-    assert all(name not in remaining_names for name in seeded_names[:6])
-    assert all(name in remaining_names for name in seeded_names[6:])
-    generated_names = [name for name in remaining_names if name not in seeded_names]
+    verification_dir = repo / "experiments" / "plan" / "iter1" / "verification"
+    assert any(verification_dir.glob("design_*.json"))
+    assert not (elsewhere / "experiments").exists()
+
+
+def test_verify_command_prunes_old_summary_artifacts(
+    prepared_repo: tuple[Path, Path], in_process_verifiers: None
+) -> None:
+    repo, state_path = prepared_repo
+    logs_dir = repo / ".autolab" / "logs"
+    seeded_names = _seed_verification_summaries(logs_dir, count=_RETENTION_LIMIT + 1)
+
+    exit_code = commands_module.main(["verify", "--state-file", str(state_path)])
+
+    assert exit_code == 0
+    remaining_names = _list_summary_names(logs_dir)
+    assert len(remaining_names) == _RETENTION_LIMIT
+    assert remaining_names.isdisjoint(seeded_names[:2])
+    assert remaining_names.issuperset(seeded_names[2:])
+    generated_names = remaining_names.difference(seeded_names)
     assert len(generated_names) == 1
 
 
-def test_verify_command_keeps_all_when_within_limit(tmp_path: Path) -> None:
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    _copy_scaffold(repo)
-    state_path = _write_state(repo)
-    _write_backlog(repo)
-    _write_agent_result(repo)
-    _write_design(repo)
-    seeded_names = _seed_verification_summaries(repo, count=199)
+def test_verify_command_keeps_all_when_within_limit(
+    prepared_repo: tuple[Path, Path], in_process_verifiers: None
+) -> None:
+    repo, state_path = prepared_repo
+    logs_dir = repo / ".autolab" / "logs"
+    seeded_names = _seed_verification_summaries(logs_dir, count=_RETENTION_LIMIT - 1)
 
     exit_code = commands_module.main(["verify", "--state-file", str(state_path)])
 
     assert exit_code == 0
-    summaries = sorted((repo / ".autolab" / "logs").glob("verification_*.json"))
-    assert len(summaries) == 200
-    remaining_names = {path.name for path in summaries}
-    assert all(name in remaining_names for name in seeded_names)
-    generated_names = [name for name in remaining_names if name not in seeded_names]
+    remaining_names = _list_summary_names(logs_dir)
+    assert len(remaining_names) == _RETENTION_LIMIT
+    assert remaining_names.issuperset(seeded_names)
+    generated_names = remaining_names.difference(seeded_names)
     assert len(generated_names) == 1
 
 
 def test_verify_command_continues_when_summary_prune_delete_fails(
-    tmp_path: Path, monkeypatch
+    prepared_repo: tuple[Path, Path], in_process_verifiers: None
 ) -> None:
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    _copy_scaffold(repo)
-    state_path = _write_state(repo)
-    _write_backlog(repo)
-    _write_agent_result(repo)
-    _write_design(repo)
-    seeded_names = _seed_verification_summaries(repo, count=205)
+    repo, state_path = prepared_repo
+    logs_dir = repo / ".autolab" / "logs"
+    seeded_names = _seed_verification_summaries(logs_dir, count=_RETENTION_LIMIT + 1)
     blocked_name = seeded_names[0]
-    original_unlink = Path.unlink
-
-    def _patched_unlink(path: Path, *args, **kwargs) -> None:
-        if path.name == blocked_name:
-            raise OSError("simulated unlink failure")
-        original_unlink(path, *args, **kwargs)
-
-    monkeypatch.setattr(Path, "unlink", _patched_unlink)
+    # A directory under a summary name makes the prune's unlink() fail with
+    # IsADirectoryError, without patching Path for the whole verify run.
+    blocked_path = logs_dir / blocked_name
+    blocked_path.unlink()
+    blocked_path.mkdir()
 
     exit_code = commands_module.main(["verify", "--state-file", str(state_path)])
 
     assert exit_code == 0
-    summaries = sorted((repo / ".autolab" / "logs").glob("verification_*.json"))
-    assert len(summaries) == 201
-    assert (repo / ".autolab" / "logs" / blocked_name).exists()
+    summary_names = _list_summary_names(logs_dir)
+    assert len(summary_names) == _RETENTION_LIMIT + 1
+    assert blocked_name in summary_names
+    assert seeded_names[1] not in summary_names
+    orchestrator_log = (logs_dir / "orchestrator.log").read_bytes()
+    assert b"verify log-retention warning" in orchestrator_log
 
 
 def test_run_with_verify_blocks_stage_transition_on_verification_failure(
     tmp_path: Path,
+    scaffold_cache: Path,
 ) -> None:
     repo = tmp_path / "repo"
     repo.mkdir()
-    _copy_scaffold(repo)
+    _copy_scaffold(repo, scaffold_cache)
     state_path = _write_state(repo)
     _write_backlog(repo)
     _write_agent_result(repo)
@@ -278,15 +457,17 @@ def test_run_with_verify_blocks_stage_transition_on_verification_failure(
     )
 
     assert exit_code == 1
-    state = json.loads(state_path.read_text(encoding="utf-8"))
+    state = _load_json(state_path)
     assert state["stage"] == "design"
     assert state["stage_attempt"] == 1
 
 
-def test_run_fails_when_active_lock_exists(tmp_path: Path) -> None:
+def test_run_fails_when_active_lock_exists(
+    tmp_path: Path, scaffold_cache: Path
+) -> None:
     repo = tmp_path / "repo"
     repo.mkdir()
-    _copy_scaffold(repo)
+    _copy_scaffold(repo, scaffold_cache)
     state_path = _write_state(repo)
     _write_backlog(repo)
     _write_agent_result(repo)
@@ -303,16 +484,18 @@ def test_run_fails_when_active_lock_exists(tmp_path: Path) -> None:
     )
 
     assert exit_code == 1
-    state = json.loads(state_path.read_text(encoding="utf-8"))
+    state = _load_json(state_path)
     assert state["stage"] == "design"
     assert state["stage_attempt"] == 0
     assert lock_path.exists()
 
 
-def test_loop_without_auto_fails_when_active_lock_exists(tmp_path: Path) -> None:
+def test_loop_without_auto_fails_when_active_lock_exists(
+    tmp_path: Path, scaffold_cache: Path
+) -> None:
     repo = tmp_path / "repo"
     repo.mkdir()
-    _copy_scaffold(repo)
+    _copy_scaffold(repo, scaffold_cache)
     state_path = _write_state(repo)
     _write_backlog(repo)
     _write_agent_result(repo)
@@ -331,7 +514,7 @@ def test_loop_without_auto_fails_when_active_lock_exists(tmp_path: Path) -> None
     )
 
     assert exit_code == 1
-    state = json.loads(state_path.read_text(encoding="utf-8"))
+    state = _load_json(state_path)
     assert state["stage"] == "design"
     assert state["stage_attempt"] == 0
     assert lock_path.exists()
@@ -339,17 +522,15 @@ def test_loop_without_auto_fails_when_active_lock_exists(tmp_path: Path) -> None
 
 def test_loop_auto_continues_after_successful_non_terminal_implementation_wave(
     tmp_path: Path,
+    scaffold_cache: Path,
     monkeypatch,
 ) -> None:
     repo = tmp_path / "repo"
     repo.mkdir()
-    _copy_scaffold(repo)
-    state_path = _write_state(repo)
+    _copy_scaffold(repo, scaffold_cache)
+    state_path = _write_state(repo, stage="implementation")
     _write_backlog(repo)
     _write_agent_result(repo)
-    state_payload = json.loads(state_path.read_text(encoding="utf-8"))
-    state_payload["stage"] = "implementation"
-    state_path.write_text(json.dumps(state_payload, indent=2), encoding="utf-8")
 
     call_count = 0
 
@@ -424,10 +605,12 @@ def test_loop_auto_continues_after_successful_non_terminal_implementation_wave(
     assert call_count == 2
 
 
-def test_skip_fails_when_active_lock_exists(tmp_path: Path) -> None:
+def test_skip_fails_when_active_lock_exists(
+    tmp_path: Path, scaffold_cache: Path
+) -> None:
     repo = tmp_path / "repo"
     repo.mkdir()
-    _copy_scaffold(repo)
+    _copy_scaffold(repo, scaffold_cache)
     state_path = _write_state(repo)
     _write_backlog(repo)
     _write_agent_result(repo)
@@ -447,16 +630,18 @@ def test_skip_fails_when_active_lock_exists(tmp_path: Path) -> None:
     )
 
     assert exit_code == 1
-    state = json.loads(state_path.read_text(encoding="utf-8"))
+    state = _load_json(state_path)
     assert state["stage"] == "design"
     assert state["stage_attempt"] == 0
     assert lock_path.exists()
 
 
-def test_run_heartbeats_lock_during_long_execution(tmp_path: Path, monkeypatch) -> None:
+def test_run_heartbeats_lock_during_long_execution(
+    tmp_path: Path, scaffold_cache: Path, monkeypatch
+) -> None:
     repo = tmp_path / "repo"
     repo.mkdir()
-    _copy_scaffold(repo)
+    _copy_scaffold(repo, scaffold_cache)
     state_path = _write_state(repo)
     _write_backlog(repo)
     _write_agent_result(repo)
@@ -519,23 +704,13 @@ def test_run_heartbeats_lock_during_long_execution(tmp_path: Path, monkeypatch)
     assert heartbeat_calls >= 3
 
 
-def test_run_blocks_on_stage_readiness_when_run_id_missing(tmp_path: Path) -> None:
+def test_run_blocks_on_stage_readiness_when_run_id_missing(
+    tmp_path: Path, scaffold_cache: Path
+) -> None:
     repo = tmp_path / "repo"
     repo.mkdir()
-    _copy_scaffold(repo)
-    state_path = repo / ".autolab" / "state.json"
-    state = {
-        "iteration_id": "iter1",
-        "experiment_id": "e1",
-        "stage": "extract_results",
-        "stage_attempt": 0,
-        "last_run_id": "",
-        "pending_run_id": "",
-        "sync_status": "na",
-        "max_stage_attempts": 3,
-        "max_total_iterations": 20,
-    }
-    state_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    _copy_scaffold(repo, scaffold_cache)
+    state_path = _write_state(repo, stage="extract_results", pending_run_id="")
     _write_backlog(repo)
     _write_agent_result(repo)
 
@@ -549,15 +724,17 @@ def test_run_blocks_on_stage_readiness_when_run_id_missing(tmp_path: Path) -> No
     )
 
     assert exit_code == 1
-    next_state = json.loads(state_path.read_text(encoding="utf-8"))
+    next_state = _load_json(state_path)
     assert next_state["stage"] == "extract_results"
     assert next_state["stage_attempt"] == 1
 
 
-def test_lock_status_reads_runtime_lock(tmp_path: Path, capsys) -> None:
+def test_lock_status_reads_runtime_lock(
+    tmp_path: Path, scaffold_cache: Path, capsys
+) -> None:
     repo = tmp_path / "repo"
     repo.mkdir()
-    _copy_scaffold(repo)
+    _copy_scaffold(repo, scaffold_cache)
     state_path = _write_state(repo)
     _write_lock(repo, state_path=state_path)
 
@@ -571,10 +748,10 @@ def test_lock_status_reads_runtime_lock(tmp_path: Path, capsys) -> None:
     assert "pid: 99999" in captured.out
 
 
-def test_lock_break_removes_runtime_lock(tmp_path: Path) -> None:
+def test_lock_break_removes_runtime_lock(tmp_path: Path, scaffold_cache: Path) -> None:
     repo = tmp_path / "repo"
     repo.mkdir()
-    _copy_scaffold(repo)
+    _copy_scaffold(repo, scaffold_cache)
     state_path = _write_state(repo)
     lock_path = _write_lock(repo, state_path=state_path)
 
@@ -595,10 +772,11 @@ def test_lock_break_removes_runtime_lock(tmp_path: Path) -> None:
 
 def test_verification_specs_skip_result_sanity_for_implementation_review(
     tmp_path: Path,
+    scaffold_cache: Path,
 ) -> None:
     repo = tmp_path / "repo"
     repo.mkdir()
-    _copy_scaffold(repo)
+    _copy_scaffold(repo, scaffold_cache)
     state = {
         "iteration_id": "iter1",
         "experiment_id": "e1",
@@ -623,10 +801,11 @@ def test_verification_specs_skip_result_sanity_for_implementation_review(
 
 def test_verification_specs_include_result_sanity_for_extract_results(
     tmp_path: Path,
+    scaffold_cache: Path,
 ) -> None:
     repo = tmp_path / "repo"
     repo.mkdir()
-    _copy_scaffold(repo)
+    _copy_scaffold(repo, scaffold_cache)
     state = {
         "iteration_id": "iter1",
         "experiment_id": "e1",
@@ -651,10 +830,11 @@ def test_verification_specs_include_result_sanity_for_extract_results(
 
 def test_verification_specs_include_design_context_quality_for_design(
     tmp_path: Path,
+    scaffold_cache: Path,
 ) -> None:
     repo = tmp_path / "repo"
     repo.mkdir()
-    _copy_scaffold(repo)
+    _copy_scaffold(repo, scaffold_cache)
     state = {
         "iteration_id": "iter1",
         "experiment_id": "e1",
@@ -678,12 +858,13 @@ def test_verification_specs_include_design_context_quality_for_design(
 
 def test_design_context_quality_verifier_fails_when_generated_report_breaks_schema(
     tmp_path: Path,
+    scaffold_cache: Path,
     monkeypatch: pytest.MonkeyPatch,
     capsys: pytest.CaptureFixture[str],
 ) -> None:
     repo = tmp_path / "repo"
     repo.mkdir()
-    _copy_scaffold(repo)
+    _copy_scaffold(repo, scaffold_cache)
     _write_state(repo)
     _write_backlog(repo)
     _write_agent_result(repo)
@@ -754,12 +935,13 @@ def test_design_context_quality_verifier_fails_when_generated_report_breaks_sche
 
 def test_design_context_quality_verifier_normalizes_schema_exception_prefix(
     tmp_path: Path,
+    scaffold_cache: Path,
     monkeypatch: pytest.MonkeyPatch,
     capsys: pytest.CaptureFixture[str],
 ) -> None:
     repo = tmp_path / "repo"
     repo.mkdir()
-    _copy_scaffold(repo)
+    _copy_scaffold(repo, scaffold_cache)
     _write_state(repo)
     _write_backlog(repo)
     _write_agent_result(repo)
@@ -797,10 +979,13 @@ def test_design_context_quality_verifier_normalizes_schema_exception_prefix(
 
 def test_verification_dry_run_iteration_placeholder_blocks_shell_injection(
     tmp_path: Path,
+    scaffold_cache: Path,
 ) -> None:
+    import yaml
+
     repo = tmp_path / "repo"
     repo.mkdir()
-    _copy_scaffold(repo)
+    _copy_scaffold(repo, scaffold_cache)
 
     policy_path = repo / ".autolab" / "verifier_policy.yaml"
     policy = yaml.safe_load(policy_path.read_text(encoding="utf-8"))
@@ -821,6 +1006,7 @@ def test_verification_dry_run_iteration_placeholder_blocks_shell_injection(
             "docs_target_update": False,
         }
     }
+    policy_path.unlink()
     policy_path.write_text(yaml.safe_dump(policy, sort_keys=False), encoding="utf-8")
 
     for verifier in (